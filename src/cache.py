@@ -0,0 +1,198 @@
+"""
+Content-addressed dataset cache.
+
+A generated database is stored under a key hashed from the effective generation
+config, the master seed, `schema.sql` and the generator code/version. A later run
+with the same key gets the cached file materialized at DB_PATH (reflink, hard
+link or plain copy) instead of regenerating it. Every artifact carries a SHA-256
+checksum that is verified before it is served; entries are evicted
+least-recently-used once the cache grows past DATASET_CACHE_MAX_BYTES.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Optional
+
+from src import config
+from src.planner import Plan
+
+# Sources whose changes alter generated output
+CODE_PATHS = ["src/main.py", "src/finalize.py", "src/generators", "src/models", "src/utils"]
+
+# Plan fields that only change how rows are produced, not which rows
+_EXECUTION_ONLY_FIELDS = {"streaming", "batch_projects", "expected_rows", "est_seconds",
+                          "est_peak_bytes", "est_db_bytes", "est_disk_bytes", "memory_budget"}
+
+_FICLONE = 0x40049409  # linux/fs.h
+
+def _sha256_file(path: str, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _code_digest() -> str:
+    h = hashlib.sha256()
+    for rel in CODE_PATHS:
+        root = Path(config.BASE_DIR) / rel
+        files = [root] if root.is_file() else sorted(root.rglob("*.py"))
+        for path in files:
+            h.update(path.relative_to(config.BASE_DIR).as_posix().encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+def effective_config(plan: Plan) -> Dict:
+    """Everything that determines the generated rows, in a JSON-serializable form."""
+    shape = {k: v for k, v in asdict(plan).items() if k not in _EXECUTION_ONLY_FIELDS}
+    with open(config.SCHEMA_PATH, "rb") as f:
+        schema_sha = hashlib.sha256(f.read()).hexdigest()
+    return {
+        "plan": shape,
+        "seed": config.SEED,
+        "reference_time": config.REFERENCE_TIME.isoformat(),
+        "start_date_offset_days": config.START_DATE_OFFSET_DAYS,
+        "archived_project_rate": config.ARCHIVED_PROJECT_RATE,
+        "unassigned_task_rate": config.UNASSIGNED_TASK_RATE,
+        "story_rate": config.STORY_RATE,
+        "llm_enabled": bool(config.GOOGLE_API_KEY),
+        "output_profile": config.OUTPUT_PROFILE,
+        "compact_page_size": config.COMPACT_PAGE_SIZE if config.OUTPUT_PROFILE == "compact" else None,
+        "schema_sha256": schema_sha,
+        "generator_version": config.GENERATOR_VERSION,
+        "code_sha256": _code_digest(),
+    }
+
+def dataset_key(cfg: Dict) -> str:
+    return hashlib.sha256(json.dumps(cfg, sort_keys=True, default=str).encode()).hexdigest()
+
+class DatasetCache:
+    def __init__(self, root: str = config.DATASET_CACHE_DIR, max_bytes: int = config.DATASET_CACHE_MAX_BYTES,
+                 link: str = config.DATASET_CACHE_LINK):
+        if link not in ("auto", "reflink", "copy"):
+            raise ValueError(f"Unknown DATASET_CACHE_LINK '{link}' (expected auto, reflink or copy)")
+        self.root = root
+        self.max_bytes = max_bytes
+        self.link = link
+
+    def _artifact(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}.sqlite")
+
+    def _meta(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}.json")
+
+    def _read_meta(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._meta(key), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, key: str, meta: Dict):
+        tmp = f"{self._meta(key)}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(meta, f, indent=2, sort_keys=True, default=str)
+        os.replace(tmp, self._meta(key))
+
+    def _materialize(self, src: str, dst: str) -> str:
+        """Places a copy of src at dst using the cheapest method the filesystem allows."""
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        tmp = f"{dst}.{os.getpid()}.tmp"
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+        method = "copy"
+        if self.link in ("auto", "reflink"):
+            try:
+                import fcntl
+                with open(src, "rb") as s, open(tmp, "wb") as d:
+                    fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+                method = "reflink"
+            except (ImportError, OSError):
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+        if method == "copy" and self.link == "auto":
+            try:
+                os.link(src, tmp)
+                method = "hardlink"
+            except OSError:
+                pass
+        if method == "copy":
+            shutil.copyfile(src, tmp)
+
+        os.replace(tmp, dst)
+        return method
+
+    def evict(self, key: str):
+        for path in (self._artifact(key), self._meta(key)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def fetch(self, key: str, dest: str) -> bool:
+        """Materializes the cached dataset for key at dest. Returns False on a miss."""
+        meta = self._read_meta(key)
+        artifact = self._artifact(key)
+        if meta is None or not os.path.exists(artifact):
+            return False
+
+        if _sha256_file(artifact) != meta.get("sha256"):
+            logging.warning(f"Cached dataset {key[:12]} failed its checksum, evicting it.")
+            self.evict(key)
+            return False
+
+        if os.path.exists(dest):
+            os.remove(dest)
+        method = self._materialize(artifact, dest)
+        meta["last_used"] = time.time()
+        self._write_meta(key, meta)
+        logging.info(f"Dataset cache hit {key[:12]} ({meta['size']} bytes, {method}) -> {dest}")
+        return True
+
+    def store(self, key: str, src: str, cfg: Dict):
+        """Adds the database at src to the cache under key, then enforces the size limit."""
+        size = os.path.getsize(src)
+        if size > self.max_bytes:
+            logging.warning(f"Dataset ({size} bytes) exceeds DATASET_CACHE_MAX_BYTES, not caching it.")
+            return
+
+        os.makedirs(self.root, exist_ok=True)
+        method = self._materialize(src, self._artifact(key))
+        now = time.time()
+        self._write_meta(key, {
+            "key": key,
+            "sha256": _sha256_file(self._artifact(key)),
+            "size": size,
+            "created_at": now,
+            "last_used": now,
+            "config": cfg,
+        })
+        logging.info(f"Cached dataset {key[:12]} ({size} bytes, {method})")
+        self.enforce_limit(keep=key)
+
+    def enforce_limit(self, keep: Optional[str] = None):
+        """Evicts least-recently-used entries until the cache fits in max_bytes."""
+        entries = []
+        for name in os.listdir(self.root):
+            if not name.endswith(".json"):
+                continue
+            key = name[:-len(".json")]
+            meta = self._read_meta(key)
+            if meta is None or not os.path.exists(self._artifact(key)):
+                self.evict(key)
+                continue
+            entries.append((meta.get("last_used", 0), key, meta.get("size", 0)))
+
+        total = sum(size for _, _, size in entries)
+        for _, key, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            logging.info(f"Evicting cached dataset {key[:12]} ({size} bytes)")
+            self.evict(key)
+            total -= size
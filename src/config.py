@@ -1,4 +1,5 @@
 import os
+from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -9,10 +10,30 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 # Database
 DB_PATH = os.path.join(BASE_DIR, "output", "asana_simulation.sqlite")
+SCHEMA_PATH = os.path.join(BASE_DIR, "schema.sql")
+OUTPUT_PROFILE = os.getenv("OUTPUT_PROFILE", "default") # default, compact (read-optimized, see src/finalize.py)
+COMPACT_PAGE_SIZE = int(os.getenv("COMPACT_PAGE_SIZE", 8192))
 
 # Simulation Settings
+SEED = int(os.getenv("SEED", 42)) # Master seed for random, Faker and UUIDs
+GENERATOR_VERSION = "1.2.0" # Bump when generated output changes for the same config/seed
 NUM_USERS = int(os.getenv("NUM_USERS", 5000)) # Scale up to 5000
 START_DATE_OFFSET_DAYS = 365 * 2 # Increase history to 2 years for user joining
+REFERENCE_TIME = datetime.fromisoformat(os.getenv("REFERENCE_TIME", "2026-01-05T09:00:00")) # Simulated "now"; fixed so a seed reproduces every date
+
+# Generator Shape (inclusive randint ranges, the planner can override these per run)
+SQUAD_SIZE_MIN = int(os.getenv("SQUAD_SIZE_MIN", 5))
+SQUAD_SIZE_MAX = int(os.getenv("SQUAD_SIZE_MAX", 15))
+PROJECTS_PER_TEAM_MIN = int(os.getenv("PROJECTS_PER_TEAM_MIN", 2))
+PROJECTS_PER_TEAM_MAX = int(os.getenv("PROJECTS_PER_TEAM_MAX", 5))
+TASKS_PER_PROJECT_MIN = int(os.getenv("TASKS_PER_PROJECT_MIN", 5))
+TASKS_PER_PROJECT_MAX = int(os.getenv("TASKS_PER_PROJECT_MAX", 25))
+
+# Dataset Cache (content-addressed by config, seed, schema and generator code)
+DATASET_CACHE = os.getenv("DATASET_CACHE", "1") != "0"
+DATASET_CACHE_DIR = os.getenv("DATASET_CACHE_DIR", os.path.join(BASE_DIR, ".cache", "datasets"))
+DATASET_CACHE_MAX_BYTES = int(os.getenv("DATASET_CACHE_MAX_BYTES", 10 * 1024 ** 3)) # Evict LRU entries beyond 10 GiB
+DATASET_CACHE_LINK = os.getenv("DATASET_CACHE_LINK", "auto") # auto (reflink > hardlink > copy), reflink, copy
 
 # API Keys
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
@@ -20,3 +41,4 @@ GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 # Probability Distributions
 ARCHIVED_PROJECT_RATE = 0.15
 UNASSIGNED_TASK_RATE = 0.15
+STORY_RATE = 0.4
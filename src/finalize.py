@@ -0,0 +1,203 @@
+"""
+Output finalization profiles.
+
+"default" leaves the generated database as written. "compact" rewrites it into a
+read-optimized layout for shipping to many readers:
+- composite-key tables become WITHOUT ROWID (no second B-tree),
+- low-cardinality categorical columns are dictionary-encoded into lookup tables,
+  with views under the original table names returning the original columns,
+- ANALYZE statistics are collected for the query planner,
+- the file is compacted with VACUUM INTO at a tuned page size.
+
+The compact database is read-only: the encoded tables are views, so INSERT/UPDATE/
+DELETE on them fail, they have no rowid, view columns carry no constraints, and
+filtering or grouping on an encoded column decodes it row by row. In the base
+tables, encoded columns lose their DEFAULT and foreign key (workspace_id codes
+reference the lookup table, not workspaces).
+"""
+import logging
+import os
+import sqlite3
+from typing import Dict, List, Set
+
+from src.config import COMPACT_PAGE_SIZE
+
+# Categorical columns worth encoding, in original schema order per table
+DICTIONARY_COLUMNS = {
+    "users": ["workspace_id", "role", "department"],
+    "teams": ["workspace_id"],
+    "team_memberships": ["role"],
+    "projects": ["workspace_id", "color"],
+    "sections": ["name"],
+    "tasks": ["workspace_id", "priority"],
+    "stories": ["target_type", "text", "type"],
+}
+MAX_DICTIONARY_SIZE = 255 # Columns with more distinct values are left inline
+
+def _columns(conn, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+def _table_sql(conn, name: str) -> str:
+    return conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)).fetchone()[0]
+
+def _composite_key_tables(conn) -> List[str]:
+    tables = [row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")]
+    return [t for t in tables
+            if sum(1 for row in conn.execute(f"PRAGMA table_info({t})") if row[5] > 0) > 1]
+
+def _rebuild_without_rowid(conn, table: str):
+    sql = _table_sql(conn, table)
+    if "WITHOUT ROWID" in sql.upper():
+        return
+    indexes = [row[0] for row in conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL", (table,))]
+    tmp = f"{table}__compact"
+    body = sql[sql.index("("):].rstrip().rstrip(";")
+    conn.execute(f"CREATE TABLE {tmp} {body} WITHOUT ROWID")
+    conn.execute(f"INSERT INTO {tmp} SELECT * FROM {table}")
+    conn.execute(f"DROP TABLE {table}")
+    conn.execute(f"ALTER TABLE {tmp} RENAME TO {table}")
+    for index_sql in indexes:
+        conn.execute(index_sql)
+    logging.info(f"Rebuilt {table} as WITHOUT ROWID")
+
+def _indexed_columns(conn, table: str) -> Set[str]:
+    cols = set()
+    for _, name, _, origin, _ in conn.execute(f"PRAGMA index_list({table})"):
+        cols.update(row[2] for row in conn.execute(f"PRAGMA index_info({name})"))
+    return cols
+
+def _base_table_sql(conn, table: str, target: str, lookups: Dict[str, str]) -> str:
+    """CREATE TABLE for target: table's columns and constraints, with encoded columns as lookup codes."""
+    info = conn.execute(f"PRAGMA table_info({table})").fetchall()  # cid, name, type, notnull, dflt, pk
+    defs = []
+    for _, name, type_, notnull, dflt, _ in info:
+        if name in lookups:
+            defs.append(f"{name}_code INTEGER REFERENCES {lookups[name]}(id)")
+            continue
+        parts = [name, type_]
+        if notnull:
+            parts.append("NOT NULL")
+        if dflt is not None:
+            parts.append(f"DEFAULT {dflt}")
+        defs.append(" ".join(p for p in parts if p))
+
+    pk = [row[1] for row in sorted(info, key=lambda r: r[5]) if row[5]]
+    if pk:
+        defs.append(f"PRIMARY KEY ({', '.join(pk)})")
+    for _, name, _, origin, _ in conn.execute(f"PRAGMA index_list({table})"):
+        if origin == "u":
+            cols = [row[2] for row in conn.execute(f"PRAGMA index_info({name})")]
+            defs.append(f"UNIQUE ({', '.join(cols)})")
+
+    fks: Dict[int, List] = {}
+    for fk_id, _, ref_table, col, ref_col, *_ in conn.execute(f"PRAGMA foreign_key_list({table})"):
+        fks.setdefault(fk_id, []).append((ref_table, col, ref_col))
+    for refs in fks.values():
+        cols = [col for _, col, _ in refs]
+        if any(col in lookups for col in cols):
+            continue
+        defs.append(f"FOREIGN KEY ({', '.join(cols)}) REFERENCES {refs[0][0]}({', '.join(r for _, _, r in refs)})")
+
+    suffix = " WITHOUT ROWID" if "WITHOUT ROWID" in _table_sql(conn, table).upper() else ""
+    return f"CREATE TABLE {target} (\n    " + ",\n    ".join(defs) + f"\n){suffix}"
+
+def _encode_table(conn, table: str, columns: List[str]) -> bool:
+    """
+    Moves table to <table>_base with dictionary-encoded columns and puts a view in its place.
+
+    The view returns the declared columns only: it has no rowid, and encoded columns
+    keep neither their DEFAULT nor their foreign key.
+    """
+    indexed = _indexed_columns(conn, table)
+    encode = []
+    for col in columns:
+        if col in indexed:
+            continue # Keep indexed columns inline so their indexes stay usable
+        distinct = conn.execute(f"SELECT COUNT(DISTINCT {col}) FROM {table}").fetchone()[0]
+        if distinct <= MAX_DICTIONARY_SIZE:
+            encode.append(col)
+    if not encode:
+        return False
+
+    original = _columns(conn, table)
+    base = f"{table}_base"
+    lookups = {col: f"{table}_{col}_lookup" for col in encode}
+    for col, lookup in lookups.items():
+        conn.execute(f"CREATE TABLE {lookup} (id INTEGER PRIMARY KEY, value TEXT NOT NULL UNIQUE)")
+        conn.execute(f"INSERT INTO {lookup} (value) SELECT DISTINCT {col} FROM {table} WHERE {col} IS NOT NULL ORDER BY {col}")
+
+    # Renaming first makes SQLite repoint other tables' foreign keys at the base table
+    conn.execute(f"ALTER TABLE {table} RENAME TO {base}")
+    indexes = [row[0] for row in conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL", (base,))]
+    conn.execute(_base_table_sql(conn, base, f"{base}__new", lookups))
+    select = ", ".join(f"(SELECT id FROM {lookups[c]} WHERE value = {base}.{c})" if c in lookups else c
+                       for c in original)
+    conn.execute(f"INSERT INTO {base}__new SELECT {select} FROM {base}")
+    conn.execute(f"DROP TABLE {base}")
+    conn.execute(f"ALTER TABLE {base}__new RENAME TO {base}")
+    for index_sql in indexes:
+        conn.execute(index_sql)
+
+    # Scalar subqueries rather than joins keep the view flattenable into any outer query,
+    # and a lookup only runs when its column is actually referenced
+    select = ", ".join(
+        f"(SELECT value FROM {lookups[c]} WHERE id = b.{c}_code) AS {c}" if c in lookups else f"b.{c}"
+        for c in original)
+    conn.execute(f"CREATE VIEW {table} AS SELECT {select} FROM {base} b")
+    logging.info(f"Dictionary-encoded {table}: {', '.join(encode)}")
+    return True
+
+def finalize_compact(db_path: str, page_size: int = COMPACT_PAGE_SIZE):
+    if sqlite3.sqlite_version_info < (3, 27, 0):
+        raise RuntimeError(f"The compact output profile needs SQLite >= 3.27 for VACUUM INTO (found {sqlite3.sqlite_version})")
+
+    size_before = os.path.getsize(db_path)
+    tmp_path = f"{db_path}.compact.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA foreign_keys = OFF")
+        conn.execute("BEGIN")
+        for table in _composite_key_tables(conn):
+            _rebuild_without_rowid(conn, table)
+        for table, columns in DICTIONARY_COLUMNS.items():
+            _encode_table(conn, table, columns)
+        conn.execute("COMMIT")
+
+        conn.execute("ANALYZE")
+        conn.execute(f"PRAGMA page_size = {int(page_size)}")
+        conn.execute("VACUUM INTO ?", (tmp_path,))
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+    size_after = os.path.getsize(db_path)
+    logging.info(f"Compacted database: {size_before} -> {size_after} bytes ({page_size}-byte pages)")
+
+OUTPUT_PROFILES = {
+    "default": None,
+    "compact": finalize_compact,
+}
+
+# Peak disk use while finalizing, as a multiple of the generated (pre-finalize) file:
+# compact rewrites the tables in place and then writes the VACUUM INTO copy beside them
+PROFILE_DISK_FACTOR = {
+    "default": 1.0,
+    "compact": 2.5,
+}
+
+def check_profile(profile: str):
+    if profile not in OUTPUT_PROFILES:
+        raise ValueError(f"Unknown OUTPUT_PROFILE '{profile}' (expected one of {sorted(OUTPUT_PROFILES)})")
+
+def finalize(db_path: str, profile: str):
+    check_profile(profile)
+    step = OUTPUT_PROFILES[profile]
+    if step is not None:
+        logging.info(f"Finalizing database with the '{profile}' output profile...")
+        step(db_path)
@@ -3,7 +3,7 @@ from typing import List, Tuple
 from src.models.models import Project, Section, Team, User
 from src.utils.llm import generate_text
 from src.utils.dates import random_date_in_range, get_business_day
-from src.config import ARCHIVED_PROJECT_RATE, GOOGLE_API_KEY
+from src.config import ARCHIVED_PROJECT_RATE, GOOGLE_API_KEY, PROJECTS_PER_TEAM_MIN, PROJECTS_PER_TEAM_MAX, REFERENCE_TIME
 from datetime import datetime, timedelta
 
 PROJECT_TEMPLATES = {
@@ -21,7 +21,7 @@ SECTIONS_TEMPLATES = {
     "Standard": ["To Do", "In Progress", "Blocked", "Done"]
 }
 
-def generate_projects(workspace_id: str, teams: List[Team], users: List[User]) -> Tuple[List[Project], List[Section]]:
+def generate_projects(workspace_id: str, teams: List[Team], users: List[User], projects_per_team: Tuple[int, int] = (PROJECTS_PER_TEAM_MIN, PROJECTS_PER_TEAM_MAX)) -> Tuple[List[Project], List[Section]]:
     projects = []
     all_sections = []
     
@@ -37,13 +37,13 @@ def generate_projects(workspace_id: str, teams: List[Team], users: List[User]) -
                 break
         
         # Decide how many projects this team has
-        num_projects = random.randint(2, 5)
+        num_projects = random.randint(*projects_per_team)
         
         for _ in range(num_projects):
             # Pick a name
             if dept != "Standard" and PROJECT_TEMPLATES.get(dept):
                 base_name = random.choice(PROJECT_TEMPLATES[dept])
-                name = f"{base_name} - {datetime.now().year}" # Avoid duplicate exact names logic later if needed
+                name = f"{base_name} - {REFERENCE_TIME.year}" # Avoid duplicate exact names logic later if needed
             else:
                  # Fallback/LLM
                  if GOOGLE_API_KEY:
@@ -54,7 +54,7 @@ def generate_projects(workspace_id: str, teams: List[Team], users: List[User]) -
             owner = random.choice(users) # logic could be tighter to pick team member
             
             # Dates
-            created_at = random_date_in_range(datetime.now() - timedelta(days=180), datetime.now())
+            created_at = random_date_in_range(REFERENCE_TIME - timedelta(days=180), REFERENCE_TIME)
             
             project = Project(
                 name=name,
@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 from src.models.models import Task, Story, Project, Section, User, TeamMembership
 from src.utils.llm import generate_text
 from src.utils.dates import random_date_in_range
-from src.config import UNASSIGNED_TASK_RATE
+from src.config import UNASSIGNED_TASK_RATE, STORY_RATE, TASKS_PER_PROJECT_MIN, TASKS_PER_PROJECT_MAX, REFERENCE_TIME
 
 # --- HARDCODED POOLS (Safety Net) ---
 # This ensures variety even if the LLM API fails or returns a single line.
@@ -34,7 +34,22 @@ COMMENTS_POOL = [
     "Updated the docs.", "Verified in production.", "Let's discuss in the standup."
 ]
 
-def generate_tasks(workspace_id, projects, sections, users, team_memberships):
+def map_project_members(projects, users, team_memberships):
+    """Maps each project id to the users of its owning team (all users as fallback)."""
+    users_by_id = {u.id: u for u in users}
+    team_user_map = {}
+    for tm in team_memberships:
+        if tm.team_id not in team_user_map: team_user_map[tm.team_id] = []
+        team_user_map[tm.team_id].append(users_by_id[tm.user_id])
+        
+    project_members = {}
+    for p in projects:
+        p_users = team_user_map.get(p.team_id) if p.team_id else None
+        project_members[p.id] = p_users if p_users else users
+    return project_members
+
+def generate_tasks(workspace_id, projects, sections, users, team_memberships,
+                   tasks_per_project=(TASKS_PER_PROJECT_MIN, TASKS_PER_PROJECT_MAX), project_members=None):
     tasks = []
     stories = []
     
@@ -43,25 +58,15 @@ def generate_tasks(workspace_id, projects, sections, users, team_memberships):
     for s in sections:
         project_sections[s.project_id].append(s)
         
-    # Map project -> team members
-    team_user_map = {}
-    for tm in team_memberships:
-        if tm.team_id not in team_user_map: team_user_map[tm.team_id] = []
-        team_user_map[tm.team_id].append(tm.user_id)
-        
-    project_members = {}
-    for p in projects:
-        if p.team_id and p.team_id in team_user_map:
-            p_users = [u for u in users if u.id in team_user_map[p.team_id]]
-            project_members[p.id] = p_users if p_users else users
-        else:
-            project_members[p.id] = users
+    # Map project -> team members (callers generating in batches pass this in precomputed)
+    if project_members is None:
+        project_members = map_project_members(projects, users, team_memberships)
 
     for project in projects:
         p_sections = project_sections.get(project.id, [])
         if not p_sections: continue
             
-        num_tasks = random.randint(5, 25)
+        num_tasks = random.randint(*tasks_per_project)
         
         for _ in range(num_tasks):
             section = random.choice(p_sections)
@@ -78,14 +83,14 @@ def generate_tasks(workspace_id, projects, sections, users, team_memberships):
                 assignee_id = random.choice(possible_assignees).id
                 
             # Dates
-            created_at = random_date_in_range(project.created_at, datetime.now())
+            created_at = random_date_in_range(project.created_at, REFERENCE_TIME)
             completed = False
             completed_at = None
             due_date = (created_at + timedelta(days=random.randint(1, 14))).date()
             
             if "done" in section.name.lower() or "complete" in section.name.lower():
                 completed = True
-                completed_at = random_date_in_range(created_at, datetime.now())
+                completed_at = random_date_in_range(created_at, REFERENCE_TIME)
             
             # 2. Entropy (Empty Descriptions)
             desc = f"Description for {name}"
@@ -107,12 +112,12 @@ def generate_tasks(workspace_id, projects, sections, users, team_memberships):
             tasks.append(task)
             
             # 3. COMMENTS FROM POOL
-            if random.random() < 0.4:
+            if random.random() < STORY_RATE:
                 story = Story(
                     target_id=task.id,
                     text=random.choice(COMMENTS_POOL),
                     created_by=random.choice(possible_assignees).id if possible_assignees else users[0].id,
-                    created_at=random_date_in_range(created_at, datetime.now())
+                    created_at=random_date_in_range(created_at, REFERENCE_TIME)
                 )
                 stories.append(story)
 
@@ -4,12 +4,13 @@ from faker import Faker
 from datetime import datetime, timedelta
 from typing import List, Tuple
 from src.models.models import User, Team, Workspace, TeamMembership
-from src.config import NUM_USERS, START_DATE_OFFSET_DAYS
+from src.config import NUM_USERS, START_DATE_OFFSET_DAYS, REFERENCE_TIME, SQUAD_SIZE_MIN, SQUAD_SIZE_MAX
 from src.utils.dates import random_date_in_range
 
 fake = Faker()
 
 DEPARTMENTS = ["Engineering", "Product", "Design", "Marketing", "Sales", "Operations"]
+DEPARTMENT_WEIGHTS = [30, 15, 10, 20, 15, 10]
 ROLES = ["Admin", "Member", "Guest"]
 
 def generate_workspace() -> Workspace:
@@ -32,7 +33,7 @@ def generate_users(workspace_id: str, count: int = NUM_USERS) -> List[User]:
         domain = fake.domain_name()
         email = f"{username}.{i}@{domain}"
         
-        dept = random.choices(DEPARTMENTS, weights=[30, 15, 10, 20, 15, 10])[0]
+        dept = random.choices(DEPARTMENTS, weights=DEPARTMENT_WEIGHTS)[0]
         role = random.choices(ROLES, weights=[5, 90, 5])[0]
         
         if i % 1000 == 0:
@@ -45,12 +46,12 @@ def generate_users(workspace_id: str, count: int = NUM_USERS) -> List[User]:
             department=dept,
             role=role,
             avatar_url=f"https://ui-avatars.com/api/?name={profile['name'].replace(' ', '+')}",
-            joined_at=random_date_in_range(datetime.now() - timedelta(days=START_DATE_OFFSET_DAYS), datetime.now())
+            joined_at=random_date_in_range(REFERENCE_TIME - timedelta(days=START_DATE_OFFSET_DAYS), REFERENCE_TIME)
         )
         users.append(user)
     return users
 
-def generate_teams(workspace_id: str, users: List[User]) -> Tuple[List[Team], List[TeamMembership]]:
+def generate_teams(workspace_id: str, users: List[User], squad_size: Tuple[int, int] = (SQUAD_SIZE_MIN, SQUAD_SIZE_MAX)) -> Tuple[List[Team], List[TeamMembership]]:
     teams = []
     memberships = []
     
@@ -81,13 +82,13 @@ def generate_teams(workspace_id: str, users: List[User]) -> Tuple[List[Team], Li
         # Shuffle
         random.shuffle(d_users)
         
-        # Chunk into squads of 5-15
+        # Chunk into squads (5-15 users by default)
         i = 0
         squad_idx = 1
         while i < len(d_users):
-            squad_size = random.randint(5, 15)
-            chunk = d_users[i : i + squad_size]
-            i += squad_size
+            size = random.randint(*squad_size)
+            chunk = d_users[i : i + size]
+            i += size
             
             if not chunk:
                 break
@@ -1,17 +1,22 @@
 import os
+import random
 import sqlite3
 import logging
 from pathlib import Path
-from src.config import DB_PATH
+from faker import Faker
+from src.config import DB_PATH, SCHEMA_PATH, SEED, DATASET_CACHE, OUTPUT_PROFILE
 from src.generators.users import generate_workspace, generate_users, generate_teams
 from src.generators.structure import generate_projects
-from src.generators.tasks import generate_tasks
+from src.generators.tasks import generate_tasks, map_project_members
+from src.planner import Plan
+from src.cache import DatasetCache, effective_config, dataset_key
+from src.finalize import finalize, check_profile
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 def init_db():
     logging.info("Initializing Database...")
-    schema_path = Path("schema.sql")
+    schema_path = Path(SCHEMA_PATH)
     if os.path.exists(DB_PATH):
         os.remove(DB_PATH)
         
@@ -61,7 +66,20 @@ def save_objects(conn, table_name, objects):
             logging.error(f"Error saving batch {i} to {table_name}: {e}")
             logging.error(f"First item in batch: {batch[0] if batch else 'Empty'}")
 
-def main():
+def main(plan: Plan = None):
+    plan = plan or Plan()
+    check_profile(OUTPUT_PROFILE)
+    
+    if DATASET_CACHE:
+        cache = DatasetCache()
+        cache_config = effective_config(plan)
+        cache_key = dataset_key(cache_config)
+        if cache.fetch(cache_key, DB_PATH):
+            logging.info(f"Simulation Complete (cached). Database at: {DB_PATH}")
+            return
+    
+    random.seed(SEED)
+    Faker.seed(SEED)
     init_db()
     
     conn = sqlite3.connect(DB_PATH)
@@ -73,28 +91,49 @@ def main():
     
     # 2. Users
     logging.info("Generating Users...")
-    users = generate_users(workspace.id)
+    users = generate_users(workspace.id, count=plan.num_users)
     save_objects(conn, "users", users)
     
     # 3. Teams & Memberships
     logging.info("Generating Teams...")
-    teams, memberships = generate_teams(workspace.id, users)
+    teams, memberships = generate_teams(workspace.id, users, squad_size=plan.squad_size)
     save_objects(conn, "teams", teams)
     save_objects(conn, "team_memberships", memberships)
     
     # 4. Projects & Sections
     logging.info("Generating Projects...")
-    projects, sections = generate_projects(workspace.id, teams, users)
+    projects, sections = generate_projects(workspace.id, teams, users, projects_per_team=plan.projects_per_team)
     save_objects(conn, "projects", projects)
     save_objects(conn, "sections", sections)
     
     # 5. Tasks & Stories
     logging.info("Generating Tasks (this may take time with LLM)...")
-    tasks, stories = generate_tasks(workspace.id, projects, sections, users, memberships)
-    save_objects(conn, "tasks", tasks)
-    save_objects(conn, "stories", stories)
+    if plan.streaming:
+        # Generate and flush one batch of projects at a time so tasks/stories never all sit in memory
+        project_members = map_project_members(projects, users, memberships)
+        project_sections = {}
+        for s in sections:
+            project_sections.setdefault(s.project_id, []).append(s)
+        for i in range(0, len(projects), plan.batch_projects):
+            batch = projects[i:i + plan.batch_projects]
+            batch_sections = [s for p in batch for s in project_sections.get(p.id, [])]
+            tasks, stories = generate_tasks(workspace.id, batch, batch_sections, users, memberships,
+                                            tasks_per_project=plan.tasks_per_project, project_members=project_members)
+            save_objects(conn, "tasks", tasks)
+            save_objects(conn, "stories", stories)
+    else:
+        tasks, stories = generate_tasks(workspace.id, projects, sections, users, memberships,
+                                        tasks_per_project=plan.tasks_per_project)
+        save_objects(conn, "tasks", tasks)
+        save_objects(conn, "stories", stories)
     
     conn.close()
+    
+    # 6. Output layout
+    finalize(DB_PATH, OUTPUT_PROFILE)
+    
+    if DATASET_CACHE:
+        cache.store(cache_key, DB_PATH, cache_config)
     logging.info(f"Simulation Complete. Database at: {DB_PATH}")
 
 if __name__ == "__main__":
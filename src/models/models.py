@@ -1,17 +1,25 @@
 from dataclasses import dataclass, field
 from typing import List, Optional, Any, Dict
 from datetime import datetime, date
+import random
 import uuid
 
+from src.config import REFERENCE_TIME
+
 def generate_uuid() -> str:
-    return str(uuid.uuid4())
+    # Drawn from the seeded `random` module so a master seed reproduces ids too
+    return str(uuid.UUID(int=random.getrandbits(128), version=4))
+
+def reference_time() -> datetime:
+    # The simulated "now", not the wall clock, so generated rows do not depend on when they are built
+    return REFERENCE_TIME
 
 @dataclass
 class Workspace:
     name: str
     domain: str
     id: str = field(default_factory=generate_uuid)
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=reference_time)
 
 @dataclass
 class User:
@@ -21,7 +29,7 @@ class User:
     department: str
     role: str = "Member"
     avatar_url: Optional[str] = None
-    joined_at: datetime = field(default_factory=datetime.now)
+    joined_at: datetime = field(default_factory=reference_time)
     id: str = field(default_factory=generate_uuid)
 
 @dataclass
@@ -29,7 +37,7 @@ class Team:
     name: str
     workspace_id: str
     description: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=reference_time)
     id: str = field(default_factory=generate_uuid)
 
 @dataclass
@@ -49,8 +57,8 @@ class Project:
     color: Optional[str] = None
     start_date: Optional[date] = None
     due_date: Optional[date] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    modified_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=reference_time)
+    modified_at: datetime = field(default_factory=reference_time)
     id: str = field(default_factory=generate_uuid)
 
 @dataclass
@@ -58,7 +66,7 @@ class Section:
     name: str
     project_id: str
     order_index: int = 0
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=reference_time)
     id: str = field(default_factory=generate_uuid)
 
 @dataclass
@@ -75,8 +83,8 @@ class Task:
     due_date: Optional[date] = None
     start_date: Optional[date] = None
     priority: str = "Medium"
-    created_at: datetime = field(default_factory=datetime.now)
-    modified_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=reference_time)
+    modified_at: datetime = field(default_factory=reference_time)
     id: str = field(default_factory=generate_uuid)
 
 @dataclass
@@ -86,7 +94,7 @@ class Story:
     created_by: str
     target_type: str = "task"
     type: str = "comment"
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=reference_time)
     id: str = field(default_factory=generate_uuid)
 
 @dataclass
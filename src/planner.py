@@ -0,0 +1,548 @@
+"""
+Target-size planner.
+
+Solves the generator parameters (user count, squad size, projects per team,
+tasks per project) for requested row counts or a target database size, then
+estimates wall time, peak memory and output size from a cost model calibrated
+by a small micro-benchmark on the current machine. Plans that would exceed the
+memory budget are switched to streaming task generation, or refused.
+
+The cost model only sees Python allocations (tracemalloc), not allocator
+overhead or SQLite's page cache, and per-row timings from a small sample run
+low at scale. Budget decisions therefore apply MEMORY_HEADROOM to the peak
+estimate, and the report shows time and memory as ranges up to the headroom.
+
+Sizes follow OUTPUT_PROFILE: calibration runs the profile's finalize step on
+the benchmark database, and the disk check reserves PROFILE_DISK_FACTOR times
+the generated size (schema pages included) for finalization.
+
+Usage:
+    python -m src.planner --tasks 5000000
+    python -m src.planner --users 2000 --db-size 500MB --memory-budget 2GB --run
+"""
+import argparse
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Optional, Tuple
+
+from src.config import (
+    DB_PATH, SCHEMA_PATH, NUM_USERS, STORY_RATE, OUTPUT_PROFILE,
+    SQUAD_SIZE_MIN, SQUAD_SIZE_MAX,
+    PROJECTS_PER_TEAM_MIN, PROJECTS_PER_TEAM_MAX,
+    TASKS_PER_PROJECT_MIN, TASKS_PER_PROJECT_MAX,
+)
+from src.generators.users import DEPARTMENTS, DEPARTMENT_WEIGHTS, generate_workspace, generate_users, generate_teams
+from src.generators.structure import PROJECT_TEMPLATES, SECTIONS_TEMPLATES, generate_projects
+from src.generators.tasks import generate_tasks
+from src.finalize import OUTPUT_PROFILES, PROFILE_DISK_FACTOR, check_profile, finalize
+
+BENCHMARK_USERS = 300
+STREAM_BATCH_PROJECTS = 500
+DEFAULT_MEMORY_FRACTION = 0.8
+TARGET_TOLERANCE = 0.1 # Relative miss allowed before a target counts as unreachable
+MEMORY_HEADROOM = 1.3 # Measured peak RSS ran ~17% over the tracemalloc-based estimate
+TIME_HEADROOM = 1.3 # Measured wall time ran ~20% over the sampled per-row cost
+SMALL_RANGE_MAX = 25 # Largest randint bound tried when searching integer shape ranges for small targets
+
+# Tables the planner can take targets for, shallowest first
+TARGET_TABLES = ["users", "team_memberships", "teams", "projects", "sections", "tasks", "stories"]
+
+# Benchmark steps and the table whose row count drives each step's cost
+STEP_DRIVERS = {"users": "users", "teams": "users", "projects": "projects", "tasks": "tasks"}
+
+_SIZE_UNITS = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3, "TB": 1024 ** 4}
+
+@dataclass
+class Plan:
+    num_users: int = NUM_USERS
+    squad_size: Tuple[int, int] = (SQUAD_SIZE_MIN, SQUAD_SIZE_MAX)
+    projects_per_team: Tuple[int, int] = (PROJECTS_PER_TEAM_MIN, PROJECTS_PER_TEAM_MAX)
+    tasks_per_project: Tuple[int, int] = (TASKS_PER_PROJECT_MIN, TASKS_PER_PROJECT_MAX)
+    streaming: bool = False
+    batch_projects: int = STREAM_BATCH_PROJECTS
+    # Filled in by estimate()
+    expected_rows: Dict[str, int] = field(default_factory=dict)
+    est_seconds: Optional[float] = None
+    est_peak_bytes: Optional[int] = None
+    est_db_bytes: Optional[int] = None   # Final file, after the output profile
+    est_disk_bytes: Optional[int] = None # Peak disk use, including finalization
+    memory_budget: Optional[int] = None
+
+@dataclass
+class CostModel:
+    """Per-driver-row costs for each generation step, measured on this machine."""
+    seconds: Dict[str, float]
+    retained_bytes: Dict[str, float]  # Python memory still held after the step
+    peak_bytes: Dict[str, float]      # Python memory high-water mark during the step
+    disk_bytes: Dict[str, float]      # Generated file, before the output profile
+    base_bytes: int = 0               # Interpreter + libraries, before any generation
+    raw_base_bytes: int = 0           # Schema-only database, before the output profile
+    profile: str = "default"
+    output_ratio: float = 1.0         # Final / generated data bytes under the profile
+    output_base_bytes: int = 0        # Final size of a finalized schema-only database
+    finalize_seconds_per_byte: float = 0.0
+
+# --- Expected row counts ---
+
+def _mean(r: Tuple[int, int]) -> float:
+    return (r[0] + r[1]) / 2
+
+def _spread(default: Tuple[int, int], mean: float) -> Tuple[int, int]:
+    """Returns a randint range centred on mean with the same relative width as default."""
+    lo, hi = default
+    ratio = (hi - lo) / (lo + hi)
+    new_lo = max(1, round(mean * (1 - ratio)))
+    new_hi = max(new_lo, round(2 * mean - new_lo))
+    return (new_lo, new_hi)
+
+def _sections_per_project() -> float:
+    # Teams are named after their department, which picks the section template
+    total = 0
+    for dept, weight in zip(DEPARTMENTS, DEPARTMENT_WEIGHTS):
+        key = dept if dept in PROJECT_TEMPLATES else "Standard"
+        total += weight * len(SECTIONS_TEMPLATES.get(key, SECTIONS_TEMPLATES["Standard"]))
+    return total / sum(DEPARTMENT_WEIGHTS)
+
+def expected_rows(plan: Plan) -> Dict[str, int]:
+    users = plan.num_users
+    # One team per department, plus squads; the last squad in each department is usually partial
+    squads = users / _mean(plan.squad_size) + min(users, len(DEPARTMENTS)) / 2
+    teams = len(DEPARTMENTS) + squads
+    projects = teams * _mean(plan.projects_per_team)
+    tasks = projects * _mean(plan.tasks_per_project)
+    return {
+        "workspaces": 1,
+        "users": users,
+        "teams": round(teams),
+        "team_memberships": 2 * users,
+        "projects": round(projects),
+        "sections": round(projects * _sections_per_project()),
+        "tasks": round(tasks),
+        "stories": round(tasks * STORY_RATE),
+    }
+
+# --- Calibration ---
+
+def _page_bytes(conn) -> int:
+    return conn.execute("PRAGMA page_count").fetchone()[0] * conn.execute("PRAGMA page_size").fetchone()[0]
+
+def _run_sample(num_users: int, trace: bool, profile: Optional[str] = None) -> Tuple[Dict[str, int], Dict[str, Dict[str, float]]]:
+    """Runs the real generators into a scratch database file and measures each step (and profile finalize)."""
+    from src.main import save_objects  # main imports this module
+
+    # A real file (not :memory:) so per-batch commits cost what they will in the full run
+    scratch = tempfile.TemporaryDirectory()
+    db_file = os.path.join(scratch.name, "benchmark.sqlite")
+    conn = sqlite3.connect(db_file)
+    with open(SCHEMA_PATH, "r") as f:
+        schema = f.read()
+    conn.executescript(schema)
+
+    state = {}
+    stats = {}
+
+    def step(name: str, fn: Callable[[], None]):
+        if trace:
+            tracemalloc.reset_peak()
+        mem_before = tracemalloc.get_traced_memory()[0] if trace else 0
+        disk_before = _page_bytes(conn)
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory() if trace else (0, 0)
+        stats[name] = {
+            "seconds": elapsed,
+            "retained": current - mem_before,
+            "peak": peak - mem_before,
+            "disk": _page_bytes(conn) - disk_before,
+        }
+
+    def users_step():
+        state["workspace"] = generate_workspace()
+        save_objects(conn, "workspaces", [state["workspace"]])
+        state["users"] = generate_users(state["workspace"].id, count=num_users)
+        save_objects(conn, "users", state["users"])
+
+    def teams_step():
+        state["teams"], state["memberships"] = generate_teams(state["workspace"].id, state["users"])
+        save_objects(conn, "teams", state["teams"])
+        save_objects(conn, "team_memberships", state["memberships"])
+
+    def projects_step():
+        state["projects"], state["sections"] = generate_projects(state["workspace"].id, state["teams"], state["users"])
+        save_objects(conn, "projects", state["projects"])
+        save_objects(conn, "sections", state["sections"])
+
+    def tasks_step():
+        state["tasks"], state["stories"] = generate_tasks(
+            state["workspace"].id, state["projects"], state["sections"], state["users"], state["memberships"])
+        save_objects(conn, "tasks", state["tasks"])
+        save_objects(conn, "stories", state["stories"])
+
+    if trace:
+        tracemalloc.start()
+    try:
+        for name, fn in [("users", users_step), ("teams", teams_step), ("projects", projects_step), ("tasks", tasks_step)]:
+            step(name, fn)
+        if profile is not None:
+            conn.close()
+            raw = os.path.getsize(db_file)
+            start = time.perf_counter()
+            finalize(db_file, profile)
+            stats["finalize"] = {"seconds": time.perf_counter() - start, "raw": raw, "final": os.path.getsize(db_file)}
+            # Schema-only baseline, so fixed per-table pages don't skew the ratio of a small sample
+            empty_file = os.path.join(scratch.name, "empty.sqlite")
+            empty = sqlite3.connect(empty_file)
+            empty.executescript(schema)
+            empty.close()
+            stats["finalize"]["empty_raw"] = os.path.getsize(empty_file)
+            finalize(empty_file, profile)
+            stats["finalize"]["empty_final"] = os.path.getsize(empty_file)
+    finally:
+        if trace:
+            tracemalloc.stop()
+        conn.close()
+        scratch.cleanup()
+
+    counts = {"users": len(state["users"]), "projects": len(state["projects"]), "tasks": len(state["tasks"])}
+    return counts, stats
+
+def _process_rss() -> int:
+    try:
+        import resource
+    except ImportError:
+        return 0
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def calibrate(sample_users: int = BENCHMARK_USERS, profile: str = OUTPUT_PROFILE) -> CostModel:
+    """Times a small generation run (finalized with profile), then repeats it under tracemalloc for memory."""
+    logging.info(f"Calibrating cost model with a {sample_users}-user micro-benchmark...")
+    base = _process_rss()
+    previous = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    try:
+        counts, timed = _run_sample(sample_users, trace=False, profile=profile)
+        mem_counts, traced = _run_sample(sample_users, trace=True)
+    finally:
+        logging.disable(previous)
+
+    def per_row(stats, counts, key):
+        return {s: stats[s][key] / max(1, counts[d]) for s, d in STEP_DRIVERS.items()}
+
+    fin = timed["finalize"]
+    return CostModel(
+        seconds=per_row(timed, counts, "seconds"),
+        retained_bytes=per_row(traced, mem_counts, "retained"),
+        peak_bytes=per_row(traced, mem_counts, "peak"),
+        disk_bytes=per_row(timed, counts, "disk"),
+        base_bytes=base,
+        profile=profile,
+        output_ratio=(fin["final"] - fin["empty_final"]) / (fin["raw"] - fin["empty_raw"]),
+        raw_base_bytes=fin["empty_raw"],
+        output_base_bytes=fin["empty_final"],
+        finalize_seconds_per_byte=fin["seconds"] / fin["raw"],
+    )
+
+# --- Estimation ---
+
+def _peak_memory(plan: Plan, model: CostModel, rows: Dict[str, int], streaming: bool) -> int:
+    drivers = {s: rows[d] for s, d in STEP_DRIVERS.items()}
+    if streaming:
+        # Only one batch of projects' tasks/stories is alive at a time
+        drivers["tasks"] = min(rows["tasks"], round(plan.batch_projects * _mean(plan.tasks_per_project)))
+    held = 0
+    peak = 0
+    for s in STEP_DRIVERS:
+        peak = max(peak, held + model.peak_bytes[s] * drivers[s])
+        held += model.retained_bytes[s] * drivers[s]
+    return int(model.base_bytes + max(peak, held))
+
+def estimate(plan: Plan, model: CostModel) -> Plan:
+    rows = expected_rows(plan)
+    plan.expected_rows = rows
+    generated = sum(model.disk_bytes[s] * rows[d] for s, d in STEP_DRIVERS.items())
+    plan.est_seconds = sum(model.seconds[s] * rows[d] for s, d in STEP_DRIVERS.items())
+    plan.est_seconds += generated * model.finalize_seconds_per_byte
+    plan.est_db_bytes = int(model.output_base_bytes + generated * model.output_ratio)
+    raw = model.raw_base_bytes + generated
+    plan.est_disk_bytes = int(raw * PROFILE_DISK_FACTOR[model.profile])
+    if OUTPUT_PROFILES[model.profile] is not None:
+        # Finalizing writes the finished copy beside the generated file (dominates for tiny databases)
+        plan.est_disk_bytes = max(plan.est_disk_bytes, int(raw) + plan.est_db_bytes)
+    plan.est_peak_bytes = _peak_memory(plan, model, rows, plan.streaming)
+    return plan
+
+def fit_to_budget(plan: Plan, model: CostModel, memory_budget: Optional[int]) -> Plan:
+    """
+    Switches to streaming if the in-memory run would not fit; raises ValueError if neither fits.
+
+    A plan fits when its peak estimate times MEMORY_HEADROOM stays within the budget.
+    """
+    plan.memory_budget = memory_budget
+    plan.streaming = False
+    estimate(plan, model)
+    if memory_budget is not None and plan.est_peak_bytes * MEMORY_HEADROOM > memory_budget:
+        plan.streaming = True
+        estimate(plan, model)
+        if plan.est_peak_bytes * MEMORY_HEADROOM > memory_budget:
+            raise ValueError(
+                f"Plan needs ~{format_bytes(plan.est_peak_bytes)} (up to {format_bytes(plan.est_peak_bytes * MEMORY_HEADROOM)}) "
+                f"even when streaming, over the {format_bytes(memory_budget)} memory budget. "
+                f"Lower the targets or raise the budget.")
+
+    out_dir = os.path.dirname(DB_PATH)
+    while not os.path.exists(out_dir):
+        out_dir = os.path.dirname(out_dir)
+    free = shutil.disk_usage(out_dir).free
+    if plan.est_disk_bytes > free:
+        raise ValueError(f"Plan needs ~{format_bytes(plan.est_disk_bytes)} of disk ('{model.profile}' output profile), "
+                         f"only {format_bytes(free)} free at {out_dir}.")
+    return plan
+
+# --- Solving ---
+
+def _solve_linear(f: Callable[[float], float], target: float, x0: float) -> float:
+    """Solves f(x) = target for an (approximately) linear f using two probes."""
+    y0, y1 = f(x0), f(2 * x0)
+    slope = (y1 - y0) / x0
+    if slope <= 0:
+        raise ValueError("Cannot solve for target: estimate does not grow with the parameter.")
+    return x0 + (target - y0) / slope
+
+def _disk_estimate(plan: Plan, model: CostModel) -> float:
+    return estimate(plan, model).est_db_bytes
+
+def validate_targets(targets: Dict[str, int], db_bytes: Optional[int] = None):
+    """Raises ValueError for targets that are malformed or conflict, which needs no cost model."""
+    unknown = set(targets) - set(TARGET_TABLES)
+    if unknown:
+        raise ValueError(f"Unsupported target tables: {sorted(unknown)}. Supported: {TARGET_TABLES}")
+    if any(v <= 0 for v in targets.values()) or (db_bytes is not None and db_bytes <= 0):
+        raise ValueError("Targets must be positive.")
+    if db_bytes is not None and ("tasks" in targets or "stories" in targets):
+        raise ValueError("A database size cannot be combined with a tasks/stories target: "
+                         "both fix the task count. Drop one of them.")
+
+def solve_plan(targets: Dict[str, int], db_bytes: Optional[int] = None, model: Optional[CostModel] = None) -> Plan:
+    """
+    Solves generator parameters for target row counts and/or a database size.
+
+    The user count comes from `users`/`team_memberships` if given, otherwise from the
+    shallowest other target (or `db_bytes`) at default shape. Remaining deeper targets
+    then reshape squad size, projects per team and tasks per project. `db_bytes` needs
+    a cost model and, when the user count is already pinned, sets tasks per project, so
+    it cannot be combined with a `tasks`/`stories` target. Raises ValueError when the
+    targets over-constrain the plan or cannot be reached.
+    """
+    validate_targets(targets, db_bytes)
+    if db_bytes is not None and model is None:
+        raise ValueError("A cost model is required to plan for a database size.")
+
+    plan = Plan()
+    given = [t for t in TARGET_TABLES if t in targets]
+
+    # 1. User count
+    if "users" in targets:
+        plan.num_users = targets["users"]
+        driver = "users"
+    elif "team_memberships" in targets:
+        plan.num_users = max(1, targets["team_memberships"] // 2)
+        driver = "team_memberships"
+    elif given:
+        driver = given[0]
+        def rows_for(u: float) -> float:
+            return expected_rows(Plan(num_users=int(u)))[driver]
+        users = _solve_linear(rows_for, targets[driver], NUM_USERS)
+        if users < len(DEPARTMENTS):
+            # Partial squads make rows non-linear in users this small: try each count instead
+            users = min(range(1, len(DEPARTMENTS) + 1), key=lambda u: abs(rows_for(u) - targets[driver]))
+        plan.num_users = max(1, round(users))
+        if not _within_tolerance(rows_for(plan.num_users), targets[driver]):
+            # Below the floor of one team per department: fit the target through the shape instead,
+            # at whichever small user count reaches it
+            error = None
+            for num_users in sorted(range(1, len(DEPARTMENTS) + 1), key=lambda u: u != plan.num_users):
+                try:
+                    return _fit_shape(replace(plan, num_users=num_users), targets, "users", db_bytes, model)
+                except ValueError as e:
+                    error = error or e
+            raise error
+    elif db_bytes is not None:
+        driver = "db_bytes"
+        plan.num_users = max(1, round(_solve_linear(lambda u: _disk_estimate(Plan(num_users=int(u)), model), db_bytes, NUM_USERS)))
+    else:
+        raise ValueError("No targets given.")
+
+    return _fit_shape(plan, targets, driver, db_bytes, model)
+
+def _fit_shape(plan: Plan, targets: Dict[str, int], driver: str, db_bytes: Optional[int],
+               model: Optional[CostModel]) -> Plan:
+    """Sets the shape parameters for targets deeper than driver, the one that fixed the user count."""
+    if "teams" in targets and driver != "teams":
+        # One team per department, plus about half a partial squad per department with users
+        floor = len(DEPARTMENTS) + min(plan.num_users, len(DEPARTMENTS)) / 2
+        squads = targets["teams"] - floor
+        if squads <= 0:
+            raise ValueError(f"More than {int(floor)} teams are needed for {plan.num_users} users "
+                             f"(one per department plus squads).")
+        plan.squad_size = _spread(plan.squad_size, plan.num_users / squads)
+
+    project_target = targets.get("projects")
+    if project_target is None and "sections" in targets:
+        project_target = targets["sections"] / _sections_per_project()
+    if project_target is not None and driver not in ("projects", "sections"):
+        plan.projects_per_team = _spread(plan.projects_per_team, project_target / expected_rows(plan)["teams"])
+        table = "projects" if "projects" in targets else "sections"
+        if not _within_tolerance(expected_rows(plan)[table], targets[table]):
+            # Small targets round badly: take the closest small integer range instead
+            plan.projects_per_team = min(_integer_ranges(SMALL_RANGE_MAX), key=lambda r: (
+                abs(expected_rows(replace(plan, projects_per_team=r))[table] - targets[table]), r[1] - r[0]))
+
+    task_target = targets.get("tasks")
+    if task_target is None and "stories" in targets:
+        task_target = targets["stories"] / STORY_RATE
+    if task_target is not None and driver not in ("tasks", "stories"):
+        _fit_task_shape(plan, task_target, reshape_projects=project_target is None)
+    elif db_bytes is not None and driver != "db_bytes":
+        def disk_for(mean: float) -> float:
+            trial = Plan(num_users=plan.num_users, squad_size=plan.squad_size,
+                         projects_per_team=plan.projects_per_team,
+                         tasks_per_project=_spread(plan.tasks_per_project, mean))
+            return _disk_estimate(trial, model)
+        mean = _solve_linear(disk_for, db_bytes, _mean(plan.tasks_per_project))
+        if mean < 1:
+            raise ValueError(f"{format_bytes(db_bytes)} is too small for {plan.num_users} users.")
+        plan.tasks_per_project = _spread(plan.tasks_per_project, mean)
+
+    _check_targets(plan, targets, db_bytes, model)
+    return plan
+
+def _within_tolerance(expected: float, target: float) -> bool:
+    return abs(expected - target) <= max(2, TARGET_TOLERANCE * target)
+
+def _integer_ranges(upper: int):
+    return [(lo, hi) for lo in range(1, upper + 1) for hi in range(lo, upper + 1)]
+
+def _fit_task_shape(plan: Plan, task_target: float, reshape_projects: bool):
+    """
+    Sets tasks per project, and projects per team if reshape_projects, for task_target.
+
+    Ranges are first spread around the needed mean. Small targets (a clamped user
+    count, few projects) make those ranges round badly, so if that misses, small
+    integer ranges for both are searched for the closest expected task count.
+    """
+    if reshape_projects and task_target < expected_rows(plan)["projects"]:
+        plan.projects_per_team = _spread(plan.projects_per_team, task_target / expected_rows(plan)["teams"])
+    plan.tasks_per_project = _spread(plan.tasks_per_project, task_target / max(1, expected_rows(plan)["projects"]))
+    if _within_tolerance(expected_rows(plan)["tasks"], task_target):
+        return
+
+    project_options = _integer_ranges(PROJECTS_PER_TEAM_MAX) if reshape_projects else [plan.projects_per_team]
+    best = None
+    for ppt in project_options:
+        for tpp in _integer_ranges(SMALL_RANGE_MAX):
+            trial = replace(plan, projects_per_team=ppt, tasks_per_project=tpp)
+            # Closest first, then the narrowest ranges so the actual count strays least
+            key = (abs(expected_rows(trial)["tasks"] - task_target), ppt[1] - ppt[0] + tpp[1] - tpp[0])
+            if best is None or key < best[0]:
+                best = (key, ppt, tpp)
+    _, plan.projects_per_team, plan.tasks_per_project = best
+
+def _check_targets(plan: Plan, targets: Dict[str, int], db_bytes: Optional[int] = None,
+                   model: Optional[CostModel] = None):
+    """Raises ValueError if the solved plan misses any requested row count or database size."""
+    rows = expected_rows(plan)
+    missed = [f"{table}: {target:,} requested, {rows[table]:,} expected"
+              for table, target in targets.items()
+              if not _within_tolerance(rows[table], target)]
+    if db_bytes is not None:
+        size = _disk_estimate(plan, model)
+        if abs(size - db_bytes) > TARGET_TOLERANCE * db_bytes:
+            missed.append(f"database size: {format_bytes(db_bytes)} requested, {format_bytes(size)} expected")
+    if missed:
+        raise ValueError("Targets cannot be reached with this generator (" + "; ".join(missed) + ").")
+
+# --- Reporting / CLI ---
+
+def parse_size(text: str) -> int:
+    text = text.strip().upper().replace("IB", "B")
+    for unit in sorted(_SIZE_UNITS, key=len, reverse=True):
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * _SIZE_UNITS[unit])
+    return int(float(text))
+
+def format_bytes(n: float) -> str:
+    for unit in ["B", "KB", "MB", "GB"]:
+        if abs(n) < 1024:
+            return f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} TB"
+
+def format_plan(plan: Plan) -> str:
+    lines = ["=== Generation Plan ==="]
+    lines.append(f"NUM_USERS: {plan.num_users}")
+    lines.append(f"Squad size: {plan.squad_size[0]}-{plan.squad_size[1]}")
+    lines.append(f"Projects per team: {plan.projects_per_team[0]}-{plan.projects_per_team[1]}")
+    lines.append(f"Tasks per project: {plan.tasks_per_project[0]}-{plan.tasks_per_project[1]}")
+    mode = f"streaming ({plan.batch_projects} projects per batch)" if plan.streaming else "in-memory"
+    lines.append(f"Mode: {mode}")
+    lines.append("\n=== Expected Rows ===")
+    for table, count in plan.expected_rows.items():
+        lines.append(f"{table}: {count:,}")
+    if plan.est_seconds is not None:
+        lines.append("\n=== Estimates ===")
+        slow = plan.est_seconds * TIME_HEADROOM
+        lines.append(f"Wall time: ~{plan.est_seconds:,.0f}-{slow:,.0f} s ({plan.est_seconds / 60:,.1f}-{slow / 60:,.1f} min)")
+        budget = f" (budget {format_bytes(plan.memory_budget)})" if plan.memory_budget else ""
+        lines.append(f"Peak memory: ~{format_bytes(plan.est_peak_bytes)}-{format_bytes(plan.est_peak_bytes * MEMORY_HEADROOM)}{budget}")
+        lines.append(f"Output size: ~{format_bytes(plan.est_db_bytes)}")
+        lines.append(f"Disk needed: ~{format_bytes(plan.est_disk_bytes)}")
+    return "\n".join(lines)
+
+def default_memory_budget() -> Optional[int]:
+    try:
+        total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return None
+    return int(total * DEFAULT_MEMORY_FRACTION)
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan a seed-data run for target table sizes.")
+    for table in TARGET_TABLES:
+        parser.add_argument(f"--{table.replace('_', '-')}", type=int, dest=table, help=f"Target {table} rows")
+    parser.add_argument("--db-size", type=parse_size, help="Target database size, e.g. 2GB")
+    parser.add_argument("--memory-budget", type=parse_size, default=default_memory_budget(),
+                        help="Peak memory allowed (default: 80%% of physical RAM)")
+    parser.add_argument("--benchmark-users", type=int, default=BENCHMARK_USERS)
+    parser.add_argument("--run", action="store_true", help="Generate the database with the resulting plan")
+    args = parser.parse_args()
+
+    targets = {t: getattr(args, t) for t in TARGET_TABLES if getattr(args, t) is not None}
+    try:
+        # Refuse what needs no cost model before spending seconds on the benchmark
+        check_profile(OUTPUT_PROFILE)
+        validate_targets(targets, args.db_size)
+        plan = solve_plan(targets) if targets and args.db_size is None else Plan()
+        model = calibrate(args.benchmark_users)
+        if args.db_size is not None:
+            plan = solve_plan(targets, db_bytes=args.db_size, model=model)
+        fit_to_budget(plan, model, args.memory_budget)
+    except ValueError as e:
+        logging.error(f"Plan refused: {e}")
+        raise SystemExit(1)
+
+    print(format_plan(plan))
+    if args.run:
+        from src.main import main as run
+        run(plan)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()